@@ -1,8 +1,12 @@
-import json
-from dataclasses import dataclass, field, asdict
+import re
+import sys
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-from enum import Enum, auto
-from typing import List, Optional, Dict, Union
+from enum import Enum, IntEnum
+from typing import Any, FrozenSet, Mapping, Optional, Dict, Sequence, Tuple, Type, Union
+
+import msgpack
+import orjson
 
 # Book categories
 VALID_CATEGORIES = [
@@ -134,53 +138,72 @@ AUDIOBOOK_FORMATS = [
     "AAX",
 ]
 
+_DIGITAL_FORMATS_ORDERED = tuple(EBOOK_FORMATS) + tuple(AUDIOBOOK_FORMATS)
+
+
+def _member_name(value: str) -> str:
+    return re.sub(r"\W+", "_", value).strip("_").upper()
+
+
+def _enum_members(values: Sequence[str]) -> Dict[str, str]:
+    members = {_member_name(value): value for value in values}
+    if len(members) != len(values):
+        raise ValueError("Duplicate or colliding enum values")
+    return members
+
 
 class Category(Enum):
     @classmethod
     def _missing_(cls, value):
-        if isinstance(value, str):
-            for member in cls:
-                if member.value.lower() == value.lower():
-                    return member
-        return None
+        if not isinstance(value, str):
+            return None
+        return cls._casefold_map.get(value.casefold())
 
+    @classmethod
+    def build_lookup(cls):
+        cls._casefold_map = {member.value.casefold(): member for member in cls}
+        return cls
 
-class BookCategory(Category):
-    def __new__(cls, category: str):
-        if category not in VALID_CATEGORIES:
-            raise ValueError(f"Invalid category {category}")
-        obj = object.__new__(cls)
-        obj._value_ = category  # pylint: disable=protected-access
-        return obj
 
-    @classmethod
-    def create_categories(cls):
-        return {category: cls(category) for category in VALID_CATEGORIES}
+def _category_enum(name: str, values: Sequence[str]) -> Type[Category]:
+    # Enum's functional API: calling a member-less enum with a name and members
+    # creates a subclass, which the linters mistake for a constructor call.
+    # pylint: disable-next=too-many-function-args
+    enum_cls = Category(name, _enum_members(values))  # type: ignore[call-arg]
+    return enum_cls.build_lookup()
 
 
-BookCategory = BookCategory.create_categories()
+BookCategory: Type[Category] = _category_enum("BookCategory", VALID_CATEGORIES)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LibraryLocation:
-    category: BookCategory
+    category: Category
     shelf: int
 
     @property
     def dict_representation(self) -> Dict[str, Union[str, int]]:
-        return asdict(self)
+        return {"category": self.category.value, "shelf": self.shelf}
 
     @property
     def json_representation(self) -> str:
-        return json.dumps(self.dict_representation)
+        return orjson.dumps(self.dict_representation).decode()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Union[str, int]]) -> "LibraryLocation":
-        return cls(category=data["category"], shelf=data["shelf"])
+        return cls.intern(BookCategory(data["category"]), data["shelf"])
+
+    @classmethod
+    def intern(cls, category: Category, shelf: int) -> "LibraryLocation":
+        key = (category, shelf)
+        location = _LOCATION_CACHE.get(key)
+        if location is None:
+            location = _LOCATION_CACHE[key] = cls(category=category, shelf=shelf)
+        return location
 
     @classmethod
     def from_json(cls, json_str: str) -> "LibraryLocation":
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     def __str__(self):
@@ -189,22 +212,29 @@ class LibraryLocation:
     def __post_init__(self):
         if not isinstance(self.category, BookCategory):
             raise ValueError(f"Invalid category {self.category}")
-        if not isinstance(self.shelf, int) or self.shelf < 1:
+        if (
+            isinstance(self.shelf, bool)
+            or not isinstance(self.shelf, int)
+            or self.shelf < 1
+        ):
             raise ValueError(f"Invalid shelf number {self.shelf}")
 
 
-@dataclass
+_LOCATION_CACHE: Dict[Tuple[Category, int], LibraryLocation] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class BookSeries:
     series: str
     number: int
 
     @property
     def dict_representation(self) -> Dict[str, Union[str, int]]:
-        return asdict(self)
+        return {"series": self.series, "number": self.number}
 
     @property
     def json_representation(self) -> str:
-        return json.dumps(self.dict_representation)
+        return orjson.dumps(self.dict_representation).decode()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Union[str, int]]) -> "BookSeries":
@@ -212,7 +242,7 @@ class BookSeries:
 
     @classmethod
     def from_json(cls, json_str: str) -> "BookSeries":
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     def __str__(self):
@@ -227,104 +257,250 @@ class BookFormat(Enum):
 
     @property
     def is_physical(self):
-        return self in {BookFormat.HARDCOVER, BookFormat.PAPERBACK}
+        return self in _PHYSICAL_FORMATS
+
 
+_PHYSICAL_FORMATS = frozenset({BookFormat.HARDCOVER, BookFormat.PAPERBACK})
 
-class BookStatus(Enum):
-    AVAILABLE = auto()
-    CHECKED_OUT = auto()
-    ON_HOLD = auto()
-    IN_REPAIR = auto()
+
+class BookStatus(IntEnum):
+    AVAILABLE = 1
+    CHECKED_OUT = 2
+    ON_HOLD = 3
+    IN_REPAIR = 4
 
     @classmethod
-    def get_valid_statuses(cls, book_format: BookFormat) -> List["BookStatus"]:
+    def get_valid_statuses(cls, book_format: BookFormat) -> FrozenSet["BookStatus"]:
         if book_format.is_physical:
-            return list(cls)
-        return [cls.AVAILABLE]
-
+            return _PHYSICAL_STATUSES
+        return _DIGITAL_STATUSES
 
-class DigitalFormat(Category):
-    def __new__(cls, formats: str):
-        if formats not in EBOOK_FORMATS + AUDIOBOOK_FORMATS:
-            raise ValueError(f"Invalid digital format {formats}")
-        obj = object.__new__(cls)
-        obj._value_ = formats  # pylint: disable=protected-access
-        return obj
 
-    @classmethod
-    def create_formats(cls):
-        return {format: cls(format) for format in EBOOK_FORMATS + AUDIOBOOK_FORMATS}
+_PHYSICAL_STATUSES = frozenset(BookStatus)
+_DIGITAL_STATUSES = frozenset({BookStatus.AVAILABLE})
 
 
-DigitalFormat = DigitalFormat.create_formats()
+DigitalFormat: Type[Category] = _category_enum(
+    "DigitalFormat", _DIGITAL_FORMATS_ORDERED
+)
 
 
-class BookCondition(Enum):
-    NEW = auto()
-    EXCELLENT = auto()
-    GOOD = auto()
-    FAIR = auto()
-    POOR = auto()
+class BookCondition(IntEnum):
+    NEW = 1
+    EXCELLENT = 2
+    GOOD = 3
+    FAIR = 4
+    POOR = 5
 
     @classmethod
-    def get_valid_conditions(cls, book_format: BookFormat) -> List["BookCondition"]:
+    def get_valid_conditions(
+        cls, book_format: BookFormat
+    ) -> FrozenSet["BookCondition"]:
         if book_format.is_physical:
-            return list(cls)
-        return [cls.NEW]
+            return _PHYSICAL_CONDITIONS
+        return _DIGITAL_CONDITIONS
+
+
+_PHYSICAL_CONDITIONS = frozenset(BookCondition)
+_DIGITAL_CONDITIONS = frozenset({BookCondition.NEW})
+
+_NAME_TO_FORMAT = {member.name: member for member in BookFormat}
+_NAME_TO_STATUS = {member.name: member for member in BookStatus}
+_NAME_TO_CONDITION = {member.name: member for member in BookCondition}
+
+
+def _iso_or_none(value: Optional[date]) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _date_or_none(value: Optional[str]) -> Optional[date]:
+    return None if value is None else date.fromisoformat(value)
+
+
+def _member_by_name(members: Mapping[str, Enum], name: str, kind: str) -> Any:
+    try:
+        return members[name]
+    except KeyError:
+        raise ValueError(f"Invalid {kind} {name}") from None
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     title: str
-    authors: list[str] = field(default_factory=list)
     isbn: str
     publication_date: date
     publisher: str
     edition: int
-    genres: list[str] = field(default_factory=list)
     number_of_pages: int
     language: str
     format: BookFormat
     summary: str
     cover_image_url: str
     current_status: BookStatus
-    location_in_library: Optional[LibraryLocation] = None
     date_added: date
     purchase_price: float
     replacement_cost: float
     dewey_decimal: str
-    keywords: list[str] = field(default_factory=list)
     reading_level: str
+    condition: BookCondition
+    barcode_number: str
+    authors: list[str] = field(default_factory=list)
+    genres: list[str] = field(default_factory=list)
+    keywords: list[str] = field(default_factory=list)
+    location_in_library: Optional[LibraryLocation] = None
     series_name_and_num: Optional[BookSeries] = None
     orig_pub_date: Optional[date] = None
     translator: Optional[str] = None
     illustrator: Optional[str] = None
-    condition: BookCondition
+    digital_file_format: Optional[Category] = None
+    digital_file_size: Optional[float] = None
+    audiobook_length: Optional[timedelta] = None
+    date_available: Optional[date] = None
     number_of_times_checked_out: int = 0
     user_ratings: Dict[str, int] = field(default_factory=dict)
     awards: list[str] = field(default_factory=list)
-    barcode_number: str
-    date_available: Optional[date] = None
-    digital_file_format: Optional[DigitalFormat] = None
-    digital_file_size: Optional[float] = None
-    audiobook_length: Optional[timedelta] = None
 
     def __post_init__(self):
-        valid_statuses = BookStatus.get_valid_statuses(self.format)
-        if self.current_status not in valid_statuses:
-            raise ValueError(
-                f"Invalid status {self.current_status} for book format {self.format}"
+        # Construction-time validation is skipped under `python -O`, e.g. for
+        # bulk loads of an already validated catalog; set_status always checks.
+        if __debug__:
+            valid_statuses = (
+                _PHYSICAL_STATUSES if self.format.is_physical else _DIGITAL_STATUSES
+            )
+            status = self.current_status
+            if not isinstance(status, BookStatus) or status not in valid_statuses:
+                raise ValueError(
+                    f"Invalid status {status!r} for book format {self.format}"
+                )
+        location = self.location_in_library
+        if location is not None:
+            self.location_in_library = LibraryLocation.intern(
+                location.category, location.shelf
             )
+        self.language = sys.intern(self.language)
+        self.dewey_decimal = sys.intern(self.dewey_decimal)
+        self.reading_level = sys.intern(self.reading_level)
+        self.genres = [sys.intern(genre) for genre in self.genres]
+        self.keywords = [sys.intern(keyword) for keyword in self.keywords]
 
     def set_status(self, new_status: BookStatus):
-        valid_statuses = BookStatus.get_valid_statuses(self.format)
-        if new_status not in valid_statuses:
-            raise ValueError(f"Cannot set status {new_status} for {self.format} book")
+        valid_statuses = (
+            _PHYSICAL_STATUSES if self.format.is_physical else _DIGITAL_STATUSES
+        )
+        if not isinstance(new_status, BookStatus) or new_status not in valid_statuses:
+            raise ValueError(f"Cannot set status {new_status!r} for {self.format} book")
         self.current_status = new_status
 
+    @property
+    def dict_representation(self) -> Dict[str, Any]:
+        location = self.location_in_library
+        series = self.series_name_and_num
+        digital_format = self.digital_file_format
+        length = self.audiobook_length
+        return {
+            "title": self.title,
+            "isbn": self.isbn,
+            "publication_date": self.publication_date.isoformat(),
+            "publisher": self.publisher,
+            "edition": self.edition,
+            "number_of_pages": self.number_of_pages,
+            "language": self.language,
+            "format": self.format.name,
+            "summary": self.summary,
+            "cover_image_url": self.cover_image_url,
+            "current_status": self.current_status.name,
+            "date_added": self.date_added.isoformat(),
+            "purchase_price": self.purchase_price,
+            "replacement_cost": self.replacement_cost,
+            "dewey_decimal": self.dewey_decimal,
+            "reading_level": self.reading_level,
+            "condition": self.condition.name,
+            "barcode_number": self.barcode_number,
+            "authors": list(self.authors),
+            "genres": list(self.genres),
+            "keywords": list(self.keywords),
+            "location_in_library": (
+                None if location is None else location.dict_representation
+            ),
+            "series_name_and_num": (
+                None if series is None else series.dict_representation
+            ),
+            "orig_pub_date": _iso_or_none(self.orig_pub_date),
+            "translator": self.translator,
+            "illustrator": self.illustrator,
+            "digital_file_format": (
+                None if digital_format is None else digital_format.value
+            ),
+            "digital_file_size": self.digital_file_size,
+            "audiobook_length": None if length is None else length.total_seconds(),
+            "date_available": _iso_or_none(self.date_available),
+            "number_of_times_checked_out": self.number_of_times_checked_out,
+            "user_ratings": dict(self.user_ratings),
+            "awards": list(self.awards),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Book":
+        location = data["location_in_library"]
+        series = data["series_name_and_num"]
+        digital_format = data["digital_file_format"]
+        length = data["audiobook_length"]
+        return cls(
+            title=data["title"],
+            isbn=data["isbn"],
+            publication_date=date.fromisoformat(data["publication_date"]),
+            publisher=data["publisher"],
+            edition=data["edition"],
+            number_of_pages=data["number_of_pages"],
+            language=data["language"],
+            format=_member_by_name(_NAME_TO_FORMAT, data["format"], "format"),
+            summary=data["summary"],
+            cover_image_url=data["cover_image_url"],
+            current_status=_member_by_name(
+                _NAME_TO_STATUS, data["current_status"], "status"
+            ),
+            date_added=date.fromisoformat(data["date_added"]),
+            purchase_price=data["purchase_price"],
+            replacement_cost=data["replacement_cost"],
+            dewey_decimal=data["dewey_decimal"],
+            reading_level=data["reading_level"],
+            condition=_member_by_name(
+                _NAME_TO_CONDITION, data["condition"], "condition"
+            ),
+            barcode_number=data["barcode_number"],
+            authors=data["authors"],
+            genres=data["genres"],
+            keywords=data["keywords"],
+            location_in_library=(
+                None if location is None else LibraryLocation.from_dict(location)
+            ),
+            series_name_and_num=(
+                None if series is None else BookSeries.from_dict(series)
+            ),
+            orig_pub_date=_date_or_none(data["orig_pub_date"]),
+            translator=data["translator"],
+            illustrator=data["illustrator"],
+            digital_file_format=(
+                None if digital_format is None else DigitalFormat(digital_format)
+            ),
+            digital_file_size=data["digital_file_size"],
+            audiobook_length=None if length is None else timedelta(seconds=length),
+            date_available=_date_or_none(data["date_available"]),
+            number_of_times_checked_out=data["number_of_times_checked_out"],
+            user_ratings=data["user_ratings"],
+            awards=data["awards"],
+        )
+
+    def to_msgpack(self) -> bytes:
+        return msgpack.packb(self.dict_representation, use_bin_type=True)
+
+    @classmethod
+    def from_msgpack(cls, packed: bytes) -> "Book":
+        return cls.from_dict(msgpack.unpackb(packed, raw=False))
+
     def format_audiobook_length(self) -> str:
         if self.audiobook_length is None:
             return "N/A"
-        hours, remainder = divmod(self.audiobook_length.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        seconds = self.audiobook_length.seconds
+        # pylint: disable-next=consider-using-f-string
+        return "%02d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
@@ -0,0 +1,85 @@
+from typing import Dict, List
+
+import numpy as np
+
+from .book import Book, BookFormat, BookStatus
+
+_FORMAT_CODES = {member: code for code, member in enumerate(BookFormat)}
+
+
+def _mean_rating(ratings: Dict[str, int]) -> float:
+    if not ratings:
+        return float("nan")
+    return sum(ratings.values()) / len(ratings)
+
+
+class BookCatalog:
+    # Column-oriented snapshot of a list of books. Each array holds one field
+    # for every book, so bulk filters and counts run as NumPy vector operations
+    # instead of per-object attribute lookups. Row i corresponds to books[i].
+    def __init__(self, books: List[Book]):
+        self.books = books
+        self.titles = [book.title for book in books]
+        self.isbns = np.array([book.isbn for book in books], dtype=str)
+        # Physical copies share an ISBN, so each ISBN maps to all of its rows.
+        self._rows_by_isbn: Dict[str, List[int]] = {}
+        for row, book in enumerate(books):
+            self._rows_by_isbn.setdefault(book.isbn, []).append(row)
+        self.statuses = np.array([book.current_status for book in books], dtype=np.int8)
+        self.formats = np.array(
+            [_FORMAT_CODES[book.format] for book in books], dtype=np.int8
+        )
+        self.pages = np.array([book.number_of_pages for book in books], dtype=np.int32)
+        self.checkouts = np.array(
+            [book.number_of_times_checked_out for book in books], dtype=np.int32
+        )
+        self.publication_years = np.array(
+            [book.publication_date.year for book in books], dtype=np.int16
+        )
+        # Ratings are aggregated at ingest; unrated books have a NaN average.
+        self.rating_counts = np.array(
+            [len(book.user_ratings) for book in books], dtype=np.int32
+        )
+        self.avg_ratings = np.array(
+            [_mean_rating(book.user_ratings) for book in books], dtype=np.float32
+        )
+
+    @classmethod
+    def from_books(cls, books: List[Book]) -> "BookCatalog":
+        return cls(list(books))
+
+    def __len__(self) -> int:
+        return len(self.books)
+
+    def to_book(self, index: int) -> Book:
+        return self.books[index]
+
+    def status_mask(self, status: BookStatus) -> np.ndarray:
+        return self.statuses == status
+
+    def format_mask(self, book_format: BookFormat) -> np.ndarray:
+        return self.formats == _FORMAT_CODES[book_format]
+
+    def available_mask(self) -> np.ndarray:
+        return self.status_mask(BookStatus.AVAILABLE)
+
+    def count_available(self) -> int:
+        return int(np.count_nonzero(self.available_mask()))
+
+    def books_where(self, mask: np.ndarray) -> List[Book]:
+        return [self.books[index] for index in np.flatnonzero(mask)]
+
+    def ratings_for(self, isbn: str) -> Dict[str, int]:
+        ratings: Dict[str, int] = {}
+        for row in self._rows_by_isbn[isbn]:
+            ratings.update(self.books[row].user_ratings)
+        return ratings
+
+    def most_checked_out(self, count: int) -> List[Book]:
+        order = np.argsort(-self.checkouts, kind="stable")[:count]
+        return [self.books[index] for index in order]
+
+    def top_rated(self, count: int, min_ratings: int = 1) -> List[Book]:
+        rated = np.flatnonzero(self.rating_counts >= min_ratings)
+        order = rated[np.argsort(-self.avg_ratings[rated], kind="stable")][:count]
+        return [self.books[index] for index in order]
@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+from src.book import Book, BookCondition, BookFormat, BookStatus
+
+
+@pytest.fixture
+def make_book():
+    def _make_book(**overrides) -> Book:
+        fields = {
+            "title": "The Hobbit",
+            "isbn": "9780547928227",
+            "publication_date": date(1937, 9, 21),
+            "publisher": "George Allen & Unwin",
+            "edition": 1,
+            "number_of_pages": 310,
+            "language": "English",
+            "format": BookFormat.HARDCOVER,
+            "summary": "A hobbit goes on an unexpected journey.",
+            "cover_image_url": "https://example.com/hobbit.jpg",
+            "current_status": BookStatus.AVAILABLE,
+            "date_added": date(2024, 1, 15),
+            "purchase_price": 14.99,
+            "replacement_cost": 19.99,
+            "dewey_decimal": "823.912",
+            "reading_level": "Middle grade",
+            "condition": BookCondition.GOOD,
+            "barcode_number": "000123",
+        }
+        fields.update(overrides)
+        return Book(**fields)
+
+    return _make_book
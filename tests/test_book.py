@@ -0,0 +1,198 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.book import (
+    Book,
+    BookCategory,
+    BookCondition,
+    BookFormat,
+    BookSeries,
+    BookStatus,
+    DigitalFormat,
+    LibraryLocation,
+)
+
+
+def test_msgpack_round_trip(make_book):
+    book = make_book(
+        format=BookFormat.AUDIOBOOK,
+        authors=["J. R. R. Tolkien"],
+        genres=["High fantasy"],
+        keywords=["dragons"],
+        location_in_library=LibraryLocation(BookCategory.HIGH_FANTASY, 3),
+        series_name_and_num=BookSeries("Middle-earth", 1),
+        orig_pub_date=date(1937, 9, 21),
+        digital_file_format=DigitalFormat.M4B,
+        digital_file_size=312.5,
+        audiobook_length=timedelta(hours=11, minutes=5, seconds=42),
+        date_available=date(2024, 2, 1),
+        number_of_times_checked_out=7,
+        user_ratings={"alice": 5, "bob": 4},
+        awards=["Carnegie Medal"],
+    )
+
+    restored = Book.from_msgpack(book.to_msgpack())
+
+    assert restored == book
+    assert restored.location_in_library == book.location_in_library
+    assert restored.series_name_and_num == book.series_name_and_num
+    assert restored.digital_file_format is DigitalFormat.M4B
+    assert restored.audiobook_length == timedelta(hours=11, minutes=5, seconds=42)
+    assert restored.publication_date == date(1937, 9, 21)
+    assert restored.orig_pub_date == date(1937, 9, 21)
+    assert restored.date_added == date(2024, 1, 15)
+    assert restored.date_available == date(2024, 2, 1)
+
+
+def test_msgpack_round_trip_without_optional_fields(make_book):
+    book = make_book()
+
+    assert Book.from_msgpack(book.to_msgpack()) == book
+
+
+@pytest.mark.parametrize("key", ["format", "current_status", "condition"])
+def test_from_dict_rejects_unknown_enum_name(make_book, key):
+    data = make_book().dict_representation
+    data[key] = "UNKNOWN"
+
+    with pytest.raises(ValueError):
+        Book.from_dict(data)
+
+
+@pytest.mark.parametrize("shelf", [True, 0, "1"])
+def test_library_location_rejects_invalid_shelf(shelf):
+    with pytest.raises(ValueError):
+        LibraryLocation.intern(BookCategory.NOIR, shelf)
+
+
+def test_library_location_intern_shares_instances():
+    location = LibraryLocation.intern(BookCategory.NOIR, 1)
+
+    assert LibraryLocation.intern(BookCategory.NOIR, 1) is location
+    assert isinstance(location.shelf, int)
+    assert not isinstance(location.shelf, bool)
+
+
+def test_books_share_interned_location(make_book):
+    first = make_book(location_in_library=LibraryLocation(BookCategory.NOIR, 2))
+    second = make_book(location_in_library=LibraryLocation(BookCategory.NOIR, 2))
+
+    assert first.location_in_library is second.location_in_library
+
+
+@pytest.mark.parametrize("status", [BookCondition.NEW, 1])
+def test_set_status_rejects_non_status_values(make_book, status):
+    book = make_book(format=BookFormat.EBOOK)
+
+    with pytest.raises(ValueError):
+        book.set_status(status)
+    assert book.current_status is BookStatus.AVAILABLE
+
+
+@pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
+@pytest.mark.parametrize("status", [BookCondition.NEW, 1])
+def test_book_rejects_non_status_values(make_book, status):
+    with pytest.raises(ValueError):
+        make_book(current_status=status)
+
+
+def test_set_status_rejects_status_invalid_for_format(make_book):
+    book = make_book(format=BookFormat.EBOOK)
+
+    with pytest.raises(ValueError):
+        book.set_status(BookStatus.ON_HOLD)
+
+
+def test_format_audiobook_length_follows_reassignment(make_book):
+    book = make_book(
+        format=BookFormat.AUDIOBOOK,
+        audiobook_length=timedelta(hours=1, minutes=2, seconds=3),
+    )
+    assert book.format_audiobook_length() == "01:02:03"
+
+    book.audiobook_length = timedelta(hours=5)
+    assert book.format_audiobook_length() == "05:00:00"
+
+    book.audiobook_length = None
+    assert book.format_audiobook_length() == "N/A"
+
+
+def test_library_location_json_round_trip():
+    location = LibraryLocation(BookCategory.DARK_FANTASY, 4)
+
+    assert location.json_representation == '{"category":"Dark fantasy","shelf":4}'
+    assert LibraryLocation.from_json(location.json_representation) == location
+
+
+def test_book_series_json_round_trip():
+    series = BookSeries("Discworld", 7)
+
+    assert series.json_representation == '{"series":"Discworld","number":7}'
+    assert BookSeries.from_json(series.json_representation) == series
+
+
+def test_dict_representation_copies_containers(make_book):
+    book = make_book(
+        authors=["A"], genres=["G"], keywords=["K"], awards=["W"], user_ratings={}
+    )
+    data = book.dict_representation
+
+    for key in ("authors", "genres", "keywords", "awards"):
+        data[key].append("extra")
+    data["user_ratings"]["carol"] = 1
+
+    assert book.authors == ["A"]
+    assert book.genres == ["G"]
+    assert book.keywords == ["K"]
+    assert book.awards == ["W"]
+    assert book.user_ratings == {}
+
+
+def test_book_interns_repeated_strings(make_book):
+    def fresh(text):
+        return "".join(list(text))
+
+    first = make_book(
+        language=fresh("English"),
+        dewey_decimal=fresh("823.912"),
+        reading_level=fresh("Middle grade"),
+        genres=[fresh("High fantasy")],
+        keywords=[fresh("dragons")],
+    )
+    second = make_book(
+        language=fresh("English"),
+        dewey_decimal=fresh("823.912"),
+        reading_level=fresh("Middle grade"),
+        genres=[fresh("High fantasy")],
+        keywords=[fresh("dragons")],
+    )
+
+    assert first.language is second.language
+    assert first.dewey_decimal is second.dewey_decimal
+    assert first.reading_level is second.reading_level
+    assert first.genres[0] is second.genres[0]
+    assert first.keywords[0] is second.keywords[0]
+
+
+def test_category_lookup_is_case_insensitive():
+    assert BookCategory("fantasy") is BookCategory.FANTASY
+    assert BookCategory("DARK FANTASY") is BookCategory.DARK_FANTASY
+    assert DigitalFormat("epub") is DigitalFormat.EPUB
+    assert DigitalFormat("m4b") is DigitalFormat.M4B
+
+
+@pytest.mark.parametrize("value", ["Not a category", 1, None])
+def test_category_lookup_rejects_unknown_values(value):
+    with pytest.raises(ValueError):
+        BookCategory(value)
+    with pytest.raises(ValueError):
+        DigitalFormat(value)
+
+
+def test_category_member_names_are_derived_from_values():
+    assert BookCategory.CHILDREN_S_FICTION.value == "Children's fiction"
+    assert BookCategory.LGBTQ.value == "LGBTQ+"
+    assert BookCategory.ACTION_ADVENTURE_FICTION.value == "Action/Adventure fiction"
+    assert BookCategory.FANTASY_ROMANCE_ROMANTASY.value == "Fantasy romance (Romantasy)"
+    assert DigitalFormat.AZW3.value == "AZW3"
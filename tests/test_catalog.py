@@ -0,0 +1,116 @@
+from datetime import date
+
+import numpy as np
+
+from src.book import BookFormat, BookStatus
+from src.catalog import BookCatalog
+
+
+def _sample_catalog(make_book):
+    return BookCatalog.from_books(
+        [
+            make_book(
+                title="A",
+                isbn="1",
+                number_of_pages=100,
+                number_of_times_checked_out=4,
+                publication_date=date(1990, 1, 1),
+            ),
+            make_book(
+                title="B",
+                isbn="2",
+                current_status=BookStatus.CHECKED_OUT,
+                format=BookFormat.PAPERBACK,
+                number_of_pages=250,
+                publication_date=date(2005, 6, 1),
+            ),
+            make_book(
+                title="C",
+                isbn="3",
+                format=BookFormat.EBOOK,
+                number_of_pages=80,
+                number_of_times_checked_out=9,
+                publication_date=date(2021, 3, 9),
+            ),
+        ]
+    )
+
+
+def test_columns(make_book):
+    catalog = _sample_catalog(make_book)
+
+    assert len(catalog) == 3
+    assert catalog.titles == ["A", "B", "C"]
+    assert catalog.isbns.tolist() == ["1", "2", "3"]
+    assert catalog.statuses.dtype == np.int8
+    assert catalog.statuses.tolist() == [
+        BookStatus.AVAILABLE,
+        BookStatus.CHECKED_OUT,
+        BookStatus.AVAILABLE,
+    ]
+    assert catalog.pages.tolist() == [100, 250, 80]
+    assert catalog.checkouts.tolist() == [4, 0, 9]
+    assert catalog.publication_years.tolist() == [1990, 2005, 2021]
+    assert catalog.to_book(1).title == "B"
+
+
+def test_masks_and_counts(make_book):
+    catalog = _sample_catalog(make_book)
+
+    assert catalog.status_mask(BookStatus.CHECKED_OUT).tolist() == [
+        False,
+        True,
+        False,
+    ]
+    assert catalog.format_mask(BookFormat.EBOOK).tolist() == [False, False, True]
+    assert catalog.available_mask().tolist() == [True, False, True]
+    assert catalog.count_available() == 2
+
+    physical_available = catalog.available_mask() & ~catalog.format_mask(
+        BookFormat.EBOOK
+    )
+    assert [book.title for book in catalog.books_where(physical_available)] == ["A"]
+
+
+def test_empty_catalog():
+    catalog = BookCatalog.from_books([])
+
+    assert len(catalog) == 0
+    assert catalog.count_available() == 0
+    assert catalog.available_mask().tolist() == []
+    assert catalog.books_where(catalog.available_mask()) == []
+
+
+def test_rating_aggregates(make_book):
+    catalog = BookCatalog.from_books(
+        [
+            make_book(isbn="1", number_of_times_checked_out=3),
+            make_book(
+                isbn="2",
+                number_of_times_checked_out=9,
+                user_ratings={"alice": 4, "bob": 5},
+            ),
+            make_book(isbn="3", number_of_times_checked_out=1, user_ratings={"c": 5}),
+        ]
+    )
+
+    assert catalog.rating_counts.tolist() == [0, 2, 1]
+    assert np.isnan(catalog.avg_ratings[0])
+    assert catalog.avg_ratings[1:].tolist() == [4.5, 5.0]
+    assert [book.isbn for book in catalog.most_checked_out(2)] == ["2", "1"]
+    assert [book.isbn for book in catalog.top_rated(5)] == ["3", "2"]
+    assert [book.isbn for book in catalog.top_rated(5, min_ratings=2)] == ["2"]
+    assert catalog.ratings_for("2") == {"alice": 4, "bob": 5}
+
+
+def test_ratings_for_merges_copies_with_same_isbn(make_book):
+    catalog = BookCatalog.from_books(
+        [
+            make_book(isbn="1", barcode_number="copy-1", user_ratings={"a": 5}),
+            make_book(isbn="2", barcode_number="other", user_ratings={"c": 3}),
+            make_book(isbn="1", barcode_number="copy-2", user_ratings={"b": 1}),
+        ]
+    )
+
+    assert catalog.ratings_for("1") == {"a": 5, "b": 1}
+    assert catalog.ratings_for("2") == {"c": 3}